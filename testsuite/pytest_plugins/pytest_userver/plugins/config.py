@@ -286,12 +286,14 @@ def _original_service_config(
     config_vars: dict
     config_yaml: dict
 
-    with open(service_config_path, mode='rt') as fp:
-        config_yaml = yaml.safe_load(fp)
+    config_yaml = yaml.safe_load(
+        pathlib.Path(service_config_path).read_bytes(),
+    )
 
     if service_config_vars_path:
-        with open(service_config_vars_path, mode='rt') as fp:
-            config_vars = yaml.safe_load(fp)
+        config_vars = yaml.safe_load(
+            pathlib.Path(service_config_vars_path).read_bytes(),
+        )
     else:
         config_vars = {}
 
@@ -1,4 +1,5 @@
 # pylint: disable=redefined-outer-name
+import os
 import pathlib
 import shutil
 import typing
@@ -35,18 +36,14 @@ def read_latest_dump(userver_dumps_root):
         specific_dir = userver_dumps_root.joinpath(dumper_name)
         if not specific_dir.is_dir():
             return None
-        latest_dump_filename = max(
-            (
-                f
-                for f in specific_dir.iterdir()
-                if specific_dir.joinpath(f).is_file()
-            ),
-            default=None,
-        )
+        with os.scandir(specific_dir) as entries:
+            latest_dump_filename = max(
+                (entry.name for entry in entries if entry.is_file()),
+                default=None,
+            )
         if not latest_dump_filename:
             return None
-        with open(specific_dir.joinpath(latest_dump_filename), 'rb') as dump:
-            return dump.read()
+        return specific_dir.joinpath(latest_dump_filename).read_bytes()
 
     return read
 
@@ -9,6 +9,10 @@ import typing
 
 logger = logging.getLogger(__name__)
 
+# Connection to a local port is either accepted or refused almost instantly,
+# there is no point in waiting for long; the health check is retried anyway.
+_TCP_CONNECT_TIMEOUT = 0.5
+
 
 # @endcond
 
@@ -38,7 +42,10 @@ class HealthChecks:
 
 async def _check_tcp_port_availability(tcp: HostPort) -> bool:
     try:
-        _, writer = await asyncio.open_connection(tcp.host, tcp.port)
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection(tcp.host, tcp.port),
+            timeout=_TCP_CONNECT_TIMEOUT,
+        )
         writer.close()
         await writer.wait_closed()
     except (OSError, asyncio.TimeoutError):